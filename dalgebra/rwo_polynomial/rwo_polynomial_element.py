@@ -23,7 +23,7 @@ from __future__ import annotations
 
 from sage.all import cartesian_product, binomial, Parent, latex
 from sage.categories.morphism import Morphism # pylint: disable=no-name-in-module
-from sage.misc.cachefunc import cached_method #pylint: disable=no-name-in-module
+from sage.misc.cachefunc import cached_method, cached_function #pylint: disable=no-name-in-module
 from sage.rings.polynomial.infinite_polynomial_ring import InfinitePolynomialGen
 from sage.rings.polynomial.infinite_polynomial_element import InfinitePolynomial_dense, InfinitePolynomial_sparse
 from sage.rings.semirings.non_negative_integer_semiring import NN
@@ -100,6 +100,7 @@ class IndexBijection_Object (Morphism):
         self.dim = size
 
     @staticmethod
+    @cached_function
     def elements_summing(n: int, l: int) -> int:
         r'''Number of elements summing `n` in `l` elements'''
         return binomial(n+l-1, n)
@@ -353,7 +354,7 @@ class RWOPolynomial (InfinitePolynomial_dense):
         var = self.variables() # we get all variables
         gens = self.parent().gens() # we get the generators of the parent
 
-        indices = [[g.index(el) for el in var if el in g] for g in gens]
+        indices = [[index for index in (g.index(el) for el in var) if index is not None] for g in gens]
 
         if self.parent().noperators() > 1:
             if operation == -1: # we need to add up each tuple
@@ -460,7 +461,7 @@ class RWOPolynomial (InfinitePolynomial_dense):
         var = self.variables() # we get all variables
         gens = self.parent().gens() # we get the generators of the parent
 
-        indices = [[g.index(el) for el in var if el in g] for g in gens]
+        indices = [[index for index in (g.index(el) for el in var) if index is not None] for g in gens]
 
         if self.parent().noperators() > 1:
             if operation == -1: # we need to add up each tuple
@@ -624,13 +625,9 @@ class RWOPolynomial (InfinitePolynomial_dense):
             return self.degree() <= 1
         
         ## This is the generic case when some variable appears in ``variables``
-        return all(
-            sum(
-                t.degree(v) 
-                for v in t.variables() 
-                if any(v in var for var in variables)
-            ) <= 1 
-        for t in self.monomials())
+        ## We check only once which algebraic variables belong to ``variables``
+        lin_vars = [v for v in self.variables() if any(v in var for var in variables)]
+        return all(sum(t.degree(v) for v in lin_vars) <= 1 for t in self.monomials())
 
     # Magic methods
     def __call__(self, *args, **kwargs) -> RWOPolynomial:
@@ -533,24 +533,37 @@ class RWOPolynomialRing_dense (InfinitePolynomialRing_dense):
         rem_names = [name for (name,gen) in zip(names,gens) if gen not in final_input]
         R = RWOPolynomialRing(self.base(), rem_names) if len(rem_names) > 0 else self.base()
         for value in final_input.values():
-            R = pushout(R, parent(value))
+            if not parent(value) is R:
+                R = pushout(R, parent(value))
         
         final_input = {key : R(value) for key,value in final_input.items()} # updating input to the output ring
 
         ### Building the elements to be used in evaluation
+        ## The operations over the values are cached, so higher orders reuse the lower ones
+        operated : dict[tuple[RWOPolynomialGen, int | tuple[int]], Element] = {}
+        def operate(gen : RWOPolynomialGen, operations : int | tuple[int]) -> Element:
+            if not (gen, operations) in operated:
+                if self.noperators() == 1:
+                    value = final_input[gen] if operations == 0 else operate(gen, operations-1).operation()
+                elif all(times == 0 for times in operations):
+                    value = final_input[gen]
+                else: # the operators commute, so we can remove any of the applied operations
+                    i = next(i for (i, times) in enumerate(operations) if times > 0)
+                    previous = tuple(times-1 if j == i else times for (j, times) in enumerate(operations))
+                    value = operate(gen, previous).operation(operation=i)
+                operated[(gen, operations)] = value
+            return operated[(gen, operations)]
+
         evaluation_dict = {}
         for variable in element.variables():
             for gen in gens:
-                if variable in gen: # we found the generator of this variable
-                    operations = gen.index(variable)
+                operations = gen.index(variable) # ``None`` when ``gen`` does not generate ``variable``
+                if operations is not None: # we found the generator of this variable
                     if gen in final_input:
-                        if self.noperators() == 1:
-                            value = final_input[gen].operation(times=operations)
-                        else:
-                            value = final_input[gen]
-                            for (i, times) in enumerate(operations):
-                                value = value.operation(operation=i, times=times)
-                        evaluation_dict[str(variable)] = R(value)
+                        if self.noperators() > 1:
+                            operations = tuple(operations)
+                        value = operate(gen, operations) # already in R: no coercion needed in general
+                        evaluation_dict[str(variable)] = value if parent(value) is R else R(value)
                     else:
                         evaluation_dict[str(variable)] = R(gen[operations])
                     break
@@ -576,7 +589,9 @@ class RWOPolynomialRing_dense (InfinitePolynomialRing_dense):
         operator : AdditiveMap = self.base().operators()[operation] 
         if ttype == "homomorphism":
             def __extended_homomorphism(element : RWOPolynomial) -> RWOPolynomial:
-                if(element in self):
+                if(isinstance(element, self.element_class) and element.parent() is self):
+                    pass # no conversion needed
+                elif(element in self):
                     element = self(element)
                 else:
                     element=self(str(element))
@@ -608,7 +623,9 @@ class RWOPolynomialRing_dense (InfinitePolynomialRing_dense):
             func = __extended_homomorphism
         elif ttype == "derivation":
             def __extended_derivation(element : RWOPolynomial) -> RWOPolynomial:
-                if(element in self):
+                if(isinstance(element, self.element_class) and element.parent() is self):
+                    pass # no conversion needed
+                elif(element in self):
                     element = self(element)
                 else:
                     element=self(str(element))
@@ -626,9 +643,15 @@ class RWOPolynomialRing_dense (InfinitePolynomialRing_dense):
                         base = c*prod([v[i]**(d[i]-1) for i in range(len(v))], self.one())
 
                         first_term = operator(c)*self(str(m))
+                        ## products of all variables but one using accumulated prefixes and suffixes
+                        prefix = [self.one()]
+                        for el in v[:-1]: prefix.append(prefix[-1]*el)
+                        suffix = [self.one()]
+                        for el in reversed(v[1:]): suffix.append(suffix[-1]*el)
+                        suffix.reverse()
                         second_term = self.zero()
                         for i in range(len(v)):
-                            to_add = d[i]*prod([v[j] for j in range(len(v)) if j != i], self.one())
+                            to_add = d[i]*prefix[i]*suffix[i]
                             for g in generators:
                                 if(g.contains(v[i])):
                                     to_add *= g.next(v[i], operation) # we create the next generator for this operation
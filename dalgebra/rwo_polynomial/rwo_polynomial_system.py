@@ -26,6 +26,7 @@ from __future__ import annotations
 import logging
 
 from functools import reduce
+from itertools import chain
 
 from sage.all import latex, ZZ, Compositions, Subsets, Parent
 from sage.categories.pushout import pushout
@@ -75,13 +76,16 @@ class RWOSystem:
         if(parent != None):
             parents.insert(0,parent)
 
-        pushed = reduce(lambda p, q : pushout(p,q), parents)
+        pushed = reduce(lambda p, q : p if p is q else pushout(p,q), parents) # pushout is expensive even for equal parents
         if(not is_RWOPolynomialRing(pushed)):
             raise TypeError("The common parent is not a ring of differential polynomials. Not valid for a RWOSystem")
 
         self.__parent : Parent = pushed
         # Building the equations
-        self.__equations : tuple[RWOPolynomial] = tuple([pushed(el) for el in equations])
+        self.__equations : tuple[RWOPolynomial] = tuple([
+            el if (isinstance(el, RWOPolynomial) and el.parent() is pushed) else pushed(el) # subsystems reuse the parent
+            for el in equations
+        ])
         
         # Checking the argument `variables`
         gens = self.parent().gens()
@@ -442,10 +446,8 @@ class RWOSystem:
                 sage: system.algebraic_variables()
                 (u_0, u_1, u_2)
         '''
-        all_vars = list(set(sum([[self.parent()(v) for v in equ.variables()] for equ in self.equations()], [])))
-        filtered = [el for el in all_vars if any(el in g for g in self.variables)]
-        filtered.sort()
-        return tuple(filtered)
+        all_vars = {self.parent()(v) for equ in self.equations() for v in equ.variables()}
+        return tuple(sorted(el for el in all_vars if any(el in g for g in self.variables)))
 
     @cached_method
     def algebraic_equations(self):
@@ -761,16 +763,16 @@ class RWOSystem:
         '''
         operation = 0 if operation is None else operation
         if alg_res == "iterative":
-            logging.info(f"We compute the resultant using iterative algorithm")
+            logger.info(f"We compute the resultant using iterative algorithm")
             return self.__iterative
         elif alg_res == "dixon":
-            logging.info(f"We compute the resultant using Dixon resultant")
+            logger.info(f"We compute the resultant using Dixon resultant")
             return self.__dixon
         elif alg_res == "macaulay":
-            logging.info(f"We compute the resultant using Macaulay resultant")
+            logger.info(f"We compute the resultant using Macaulay resultant")
             return self.__macaulay
         elif alg_res == "auto":
-            logging.info("Deciding automatically the algorithm for the resultant...")
+            logger.info("Deciding automatically the algorithm for the resultant...")
             if self.is_linear():
                 logger.info("The system is linear: we use Macaulay resultant")
                 return self.__macaulay
@@ -786,7 +788,8 @@ class RWOSystem:
 
         ## auxiliary generator to iterate in a "balanced way"
         def gen_cartesian(size, bound):
-            for i in range(bound*size):
+            # tuples in [0,bound-1]^size sum at most size*(bound-1): bigger sums have no compositions
+            for i in range(min(bound*size, size*(bound-1)+1)):
                 for c in Compositions(i+size, length=size, max_part=bound): #pylint: disable=unexpected-keyword-arg
                     yield tuple([el-1 for el in c])
 
@@ -879,7 +882,8 @@ class RWOSystem:
                 if len(equs_by_order) < 2:
                     raise ValueError(f"Not enough equations to eliminate {repr(v)}")
                 pivot = self.equation(equs_by_order[0])
-                logger.info(f"Picked the pivot [{str(pivot)[:30]}...] for differential elimination")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"Picked the pivot [{str(pivot)[:30]}...] for differential elimination")
                 logger.info(f"Computing the elimination for all pair of equations...")
                 new_equs = [
                     self.subsystem([equs_by_order[0], i], variables=[v]).diff_resultant(bound, operation, alg_res) 
@@ -899,7 +903,8 @@ class RWOSystem:
             L = self.__get_extension(bound, operation)
             system = self.extend_by_operation(L, operation) # now we can eliminate everything
             alg_equs = list(system.algebraic_equations())
-            alg_vars = [alg_equs[0].parent()(str(el)) for el in system.algebraic_variables()]
+            alg_ring = alg_equs[0].parent(); alg_gens = alg_ring.gens_dict() # avoid parsing the names when possible
+            alg_vars = [alg_gens[name] if name in alg_gens else alg_ring(name) for name in (str(el) for el in system.algebraic_variables())]
 
             logger.info(f"Iterating to remove all the algebraic variables...")
             logger.info(f"--------------------------------------------------")
@@ -921,17 +926,19 @@ class RWOSystem:
                 pivot = alg_equs.pop(degrees[iv].index(min([el for el in degrees[iv] if el > 0])))
                 R = pivot.parent()
                 pivot = self.__iterative_to_univariate(pivot, v)
-                logger.info(f"\t- Pivot --> {str(pivot)[:30]}... [with {len(pivot.monomials())} monomials and coefficients {max(len(str(c)) for c in pivot.coefficients())} long]")
+                if logger.isEnabledFor(logging.INFO): # avoid printing the polynomials when not needed
+                    logger.info(f"\t- Pivot --> {str(pivot)[:30]}... [with {len(pivot.monomials())} monomials and coefficients {max(len(str(c)) for c in pivot.coefficients())} long]")
                 logger.info(f"\tEliminating the variable {v} in each pair of equations...")
                 for i in range(len(alg_equs)):
                     if alg_equs[i].degree(v) > 0:
                         equ_to_eliminate = self.__iterative_to_univariate(alg_equs[i], v)
-                        logger.info(f"\tEliminating with {str(equ_to_eliminate)[:30]}... [with {len(equ_to_eliminate.monomials())} monomials and coefficients {max(len(str(c)) for c in equ_to_eliminate.coefficients())} long]")
+                        if logger.isEnabledFor(logging.INFO):
+                            logger.info(f"\tEliminating with {str(equ_to_eliminate)[:30]}... [with {len(equ_to_eliminate.monomials())} monomials and coefficients {max(len(str(c)) for c in equ_to_eliminate.coefficients())} long]")
                         logger.info(f"\tComputing Sylvester matrix...")
 
                         syl_mat = pivot.sylvester_matrix(equ_to_eliminate)
-                        if len(alg_vars) == 0:
-                            logger.info(f"\tStoring Sylvester matrix...")
+                        if len(alg_vars) == 0 and logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"\tStoring Sylvester matrix...")
                             with open("./sylvester_matrix.txt", "w") as syl_file:
                                 syl_file.write(f"{syl_mat.nrows()},{syl_mat.ncols()}\n")
                                 for r in range(syl_mat.nrows()):
@@ -944,7 +951,7 @@ class RWOSystem:
             logger.info(f"--------------------------------------------------")
             logger.info(f"Elimination procedure finished. Checking that we have a result...")
             old_vars = self.algebraic_variables()
-            new_vars = list(set(sum([list(set(el.variables())) for el in alg_equs],[])))
+            new_vars = list(set(chain.from_iterable(el.variables() for el in alg_equs)))
             if any(el in old_vars for el in new_vars):
                 raise ValueError(f"A variable that had to be eliminated remains!!\n\
                     \t-Old vars: {old_vars}\n\
@@ -959,12 +966,14 @@ class RWOSystem:
             Method to choose the best variable to do univariate elimination.
         '''
         v = self.variables[0]
+        polynomials = [equ.polynomial() for equ in self.equations()] # shared by all the measures
         def measure(v):
             c = 0
-            for equ in self.equations():
-                for t in equ.polynomial().variables():
-                    if t in v:
-                        c += v.index(t)**equ.polynomial().degree(t)
+            for polynomial in polynomials:
+                for t in polynomial.variables():
+                    index = v.index(t)
+                    if index is not None:
+                        c += index**polynomial.degree(t)
             return c
         m = measure(v)
         for nv in self.variables[1:]: